@@ -1,12 +1,5 @@
 # Just for Demo 
-from fastmcp import FastMCP
-from mcp import app  # Import FastAPI app
-
-# Convert FastAPI into MCP server
-mcp = FastMCP.from_fastapi(
-    app=app,
-    name="Expense Tracker Server"
-)
+from tracker import mcp  # Expense tracker MCP server
 
 if __name__ == "__main__":
     mcp.run()
\ No newline at end of file
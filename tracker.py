@@ -0,0 +1,739 @@
+from fastmcp import FastMCP
+import os
+import pathlib
+import sqlite3
+import threading
+import queue
+import time
+import atexit
+import logging
+from contextlib import contextmanager
+import json
+import csv
+import io
+import re
+import calendar
+from typing import Optional, List, Dict, Any
+
+BASE_DIR = os.getcwd()
+DB_PATH = os.path.join(BASE_DIR, "expenses.db")
+CATEGORIES_PATH = os.path.join(BASE_DIR, "categories.json")
+
+mcp = FastMCP("ExpenseTracker")
+
+# One long-lived connection shared by every tool. Opening a connection per
+# call throws away SQLite's page cache and pays the open/close syscalls on
+# every request. isolation_level=None puts the connection in autocommit
+# mode, and _LOCK serializes access since tools may run on worker threads.
+_CONN = sqlite3.connect(
+    DB_PATH, check_same_thread=False, isolation_level=None, cached_statements=256
+)
+_CONN.row_factory = sqlite3.Row
+_LOCK = threading.Lock()
+
+_INSERT_SQL = "INSERT INTO expenses(date, amount, category, subcategory, note) VALUES (?,?,?,?,?)"
+
+_EXPENSE_COLUMNS = "id, date, amount, category, subcategory, note"
+
+# UPDATE/DELETE ... RETURNING needs SQLite 3.35+; older builds fall back to
+# a SELECT inside the same transaction. RETURNING skips column affinity, so
+# amount is cast to keep it a float like every other read.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_RETURNING_COLUMNS = "id, date, CAST(amount AS REAL) AS amount, category, subcategory, note"
+
+logger = logging.getLogger(__name__)
+
+@contextmanager
+def _transaction():
+    """Hold the connection lock and run the block as one write transaction.
+    
+    BEGIN IMMEDIATE takes the write lock up front, so the block never fails
+    halfway with SQLITE_BUSY; any exception rolls the whole block back.
+    """
+    with _LOCK:
+        _CONN.execute("BEGIN IMMEDIATE")
+        try:
+            yield _CONN
+            _CONN.execute("COMMIT")
+        except BaseException:
+            # SQLite may already have rolled back on its own (e.g. SQLITE_FULL);
+            # a failed COMMIT, on the other hand, leaves the transaction open
+            if _CONN.in_transaction:
+                _CONN.execute("ROLLBACK")
+            raise
+
+def init_db():
+    """Initialize database with necessary tables."""
+    with _LOCK:
+        conn = _CONN
+        # WAL lets readers run alongside a writer and, with synchronous=NORMAL,
+        # avoids an fsync on every commit. SQLite keeps expenses.db-wal and
+        # expenses.db-shm next to the database while in this mode.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=5000")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS expenses(
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                amount REAL NOT NULL,
+                category TEXT NOT NULL,
+                subcategory TEXT DEFAULT '',
+                note TEXT DEFAULT '',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # idx_expenses_date stays: it is ordered by (date, rowid), which is
+        # what every "ORDER BY date DESC, id DESC" query needs
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)")
+        
+        # Composite indexes for the date-range and category filters used by
+        # list_expenses and summarize. (category, date) supersedes the old
+        # category-only index.
+        conn.execute("DROP INDEX IF EXISTS idx_expenses_category")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date_cat ON expenses(date, category)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_expenses_cat_date ON expenses(category, date)")
+        
+        # Per-month totals kept in step with expenses by triggers, so
+        # get_statistics reads a handful of rows instead of scanning the table
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS monthly_rollup(
+                month TEXT PRIMARY KEY,
+                count INTEGER NOT NULL,
+                total REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_monthly_rollup_insert
+            AFTER INSERT ON expenses
+            BEGIN
+                INSERT INTO monthly_rollup(month, count, total)
+                VALUES (substr(NEW.date, 1, 7), 1, NEW.amount)
+                ON CONFLICT(month) DO UPDATE SET
+                    count = count + excluded.count,
+                    total = total + excluded.total;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_monthly_rollup_delete
+            AFTER DELETE ON expenses
+            BEGIN
+                UPDATE monthly_rollup SET count = count - 1, total = total - OLD.amount
+                WHERE month = substr(OLD.date, 1, 7);
+                DELETE FROM monthly_rollup
+                WHERE month = substr(OLD.date, 1, 7) AND count <= 0;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_monthly_rollup_update
+            AFTER UPDATE OF date, amount ON expenses
+            BEGIN
+                UPDATE monthly_rollup SET count = count - 1, total = total - OLD.amount
+                WHERE month = substr(OLD.date, 1, 7);
+                DELETE FROM monthly_rollup
+                WHERE month = substr(OLD.date, 1, 7) AND count <= 0;
+                INSERT INTO monthly_rollup(month, count, total)
+                VALUES (substr(NEW.date, 1, 7), 1, NEW.amount)
+                ON CONFLICT(month) DO UPDATE SET
+                    count = count + excluded.count,
+                    total = total + excluded.total;
+            END
+        """)
+        
+        # Per-day, per-(sub)category totals for summarize, maintained the same
+        # way. Its size grows with days x categories, not with expense count.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS agg_by_day_cat(
+                date TEXT NOT NULL,
+                category TEXT NOT NULL,
+                subcategory TEXT NOT NULL,
+                cnt INTEGER NOT NULL,
+                total REAL NOT NULL,
+                PRIMARY KEY (date, category, subcategory)
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_agg_by_day_cat_insert
+            AFTER INSERT ON expenses
+            BEGIN
+                INSERT INTO agg_by_day_cat(date, category, subcategory, cnt, total)
+                VALUES (NEW.date, NEW.category, COALESCE(NEW.subcategory, ''), 1, NEW.amount)
+                ON CONFLICT(date, category, subcategory) DO UPDATE SET
+                    cnt = cnt + excluded.cnt,
+                    total = total + excluded.total;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_agg_by_day_cat_delete
+            AFTER DELETE ON expenses
+            BEGIN
+                UPDATE agg_by_day_cat SET cnt = cnt - 1, total = total - OLD.amount
+                WHERE date = OLD.date AND category = OLD.category
+                  AND subcategory = COALESCE(OLD.subcategory, '');
+                DELETE FROM agg_by_day_cat
+                WHERE date = OLD.date AND category = OLD.category
+                  AND subcategory = COALESCE(OLD.subcategory, '') AND cnt <= 0;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_agg_by_day_cat_update
+            AFTER UPDATE OF date, amount, category, subcategory ON expenses
+            BEGIN
+                UPDATE agg_by_day_cat SET cnt = cnt - 1, total = total - OLD.amount
+                WHERE date = OLD.date AND category = OLD.category
+                  AND subcategory = COALESCE(OLD.subcategory, '');
+                DELETE FROM agg_by_day_cat
+                WHERE date = OLD.date AND category = OLD.category
+                  AND subcategory = COALESCE(OLD.subcategory, '') AND cnt <= 0;
+                INSERT INTO agg_by_day_cat(date, category, subcategory, cnt, total)
+                VALUES (NEW.date, NEW.category, COALESCE(NEW.subcategory, ''), 1, NEW.amount)
+                ON CONFLICT(date, category, subcategory) DO UPDATE SET
+                    cnt = cnt + excluded.cnt,
+                    total = total + excluded.total;
+            END
+        """)
+        
+    # Rebuild the aggregates from scratch on startup so they also cover
+    # rows written before they existed (or by anything bypassing the triggers)
+    with _transaction() as conn:
+        conn.execute("DELETE FROM monthly_rollup")
+        conn.execute("""
+            INSERT INTO monthly_rollup(month, count, total)
+            SELECT substr(date, 1, 7), COUNT(*), SUM(amount)
+            FROM expenses
+            GROUP BY substr(date, 1, 7)
+        """)
+        conn.execute("DELETE FROM agg_by_day_cat")
+        conn.execute("""
+            INSERT INTO agg_by_day_cat(date, category, subcategory, cnt, total)
+            SELECT date, category, COALESCE(subcategory, ''), COUNT(*), SUM(amount)
+            FROM expenses
+            GROUP BY date, category, COALESCE(subcategory, '')
+        """)
+    
+    # Give the query planner statistics to choose between the indexes
+    with _LOCK:
+        _CONN.execute("ANALYZE")
+
+init_db()
+
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
+def _valid_date(value: Any) -> bool:
+    """Cheap YYYY-MM-DD check; avoids building a datetime just to validate."""
+    if not isinstance(value, str):
+        return False
+    m = _DATE_RE.fullmatch(value)
+    if not m:
+        return False
+    year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    return 1 <= year and 1 <= month <= 12 and 1 <= day <= calendar.monthrange(year, month)[1]
+
+# Non-durable add_expense calls are queued here and committed by a background
+# thread in batches, so a burst of single inserts shares one transaction
+_WRITE_Q = queue.Queue()
+_WRITE_MAX_BATCH = 500
+_WRITE_MAX_WAIT = 0.02  # seconds to keep collecting after the first row
+_WRITE_RETRIES = 3
+_WRITE_RETRY_DELAY = 0.5  # seconds, doubled after each failed attempt
+
+def _flush_writes(rows):
+    """Commit queued rows, retrying the batch and then falling back to one row at a time.
+    
+    The caller was already told the rows were queued, so a failure must not
+    drop the whole batch: transient errors (e.g. SQLITE_BUSY from another
+    process) are retried, and if the batch still fails each row is inserted
+    on its own so only the rows that really fail are lost and logged.
+    """
+    delay = _WRITE_RETRY_DELAY
+    for attempt in range(1, _WRITE_RETRIES + 1):
+        try:
+            with _transaction() as conn:
+                conn.executemany(_INSERT_SQL, rows)
+            return
+        except sqlite3.OperationalError:
+            logger.warning(
+                "Writing %d queued expenses failed (attempt %d/%d)",
+                len(rows), attempt, _WRITE_RETRIES, exc_info=True
+            )
+            if attempt < _WRITE_RETRIES:
+                time.sleep(delay)
+                delay *= 2
+        except sqlite3.Error:
+            # A bad row fails the batch the same way every time
+            logger.warning("Batch of %d queued expenses rejected", len(rows), exc_info=True)
+            break
+    
+    for row in rows:
+        try:
+            with _transaction() as conn:
+                conn.execute(_INSERT_SQL, row)
+        except sqlite3.Error:
+            logger.exception("Dropped queued expense %r", row)
+
+def _write_loop():
+    """Drain the write queue forever, committing each batch in one transaction."""
+    while True:
+        rows = [_WRITE_Q.get()]
+        try:
+            deadline = time.monotonic() + _WRITE_MAX_WAIT
+            while len(rows) < _WRITE_MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(_WRITE_Q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            _flush_writes(rows)
+        except Exception:
+            # Keep the thread alive: if it died, the atexit join would hang
+            logger.exception("Unexpected error writing %d queued expenses", len(rows))
+        finally:
+            for _ in rows:
+                _WRITE_Q.task_done()
+
+threading.Thread(target=_write_loop, name="expense-writer", daemon=True).start()
+# Make sure queued expenses reach the database before the process exits
+atexit.register(_WRITE_Q.join)
+
+@mcp.tool()
+def add_expense(
+    date: str,
+    amount: float,
+    category: str,
+    subcategory: str = "",
+    note: str = "",
+    durable: bool = True
+) -> Dict[str, Any]:
+    '''Add a new expense entry to the database.
+    
+    Args:
+        date: Expense date (YYYY-MM-DD format)
+        amount: Expense amount
+        category: Main category (e.g., Food, Transportation)
+        subcategory: Optional subcategory (e.g., Groceries, Restaurants)
+        note: Optional note about the expense
+        durable: If False, queue the expense and return immediately; it is
+            committed in a batch shortly after and no ID is returned
+    '''
+    # Validate date format
+    if not _valid_date(date):
+        return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
+    
+    if amount <= 0:
+        return {"status": "error", "message": "Amount must be positive"}
+    
+    if not durable:
+        _WRITE_Q.put((date, amount, category, subcategory, note))
+        return {"status": "queued", "message": "Expense queued for writing"}
+    
+    with _transaction() as conn:
+        cursor = conn.execute(
+            _INSERT_SQL,
+            (date, amount, category, subcategory, note)
+        )
+        return {
+            "status": "success", 
+            "id": cursor.lastrowid,
+            "message": f"Expense added successfully (ID: {cursor.lastrowid})"
+        }
+
+@mcp.tool()
+def add_expenses(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    '''Add many expense entries in a single transaction.
+    
+    Args:
+        rows: List of expenses, each with "date" (YYYY-MM-DD), "amount" and
+            "category", plus optional "subcategory" and "note"
+    '''
+    if not rows:
+        return {"status": "error", "message": "No expenses to add"}
+    
+    # Validate everything up front so a bad row never leaves a partial import
+    params = []
+    for i, row in enumerate(rows):
+        try:
+            date = row["date"]
+            amount = row["amount"]
+            category = row["category"]
+        except KeyError as e:
+            return {"status": "error", "message": f"Row {i}: missing field {e.args[0]}"}
+        if not _valid_date(date):
+            return {"status": "error", "message": f"Row {i}: Invalid date format. Use YYYY-MM-DD"}
+        if not isinstance(amount, (int, float)) or isinstance(amount, bool):
+            return {"status": "error", "message": f"Row {i}: Amount must be a number"}
+        if amount <= 0:
+            return {"status": "error", "message": f"Row {i}: Amount must be positive"}
+        if not isinstance(category, str) or not category:
+            return {"status": "error", "message": f"Row {i}: Category must be a non-empty string"}
+        subcategory = row.get("subcategory") or ""
+        note = row.get("note") or ""
+        if not isinstance(subcategory, str) or not isinstance(note, str):
+            return {"status": "error", "message": f"Row {i}: Subcategory and note must be strings"}
+        params.append((date, amount, category, subcategory, note))
+    
+    with _transaction() as conn:
+        cursor = conn.executemany(_INSERT_SQL, params)
+        last_id = conn.execute("SELECT last_insert_rowid()").fetchone()[0]
+        inserted = cursor.rowcount
+        return {
+            "status": "success",
+            "inserted": inserted,
+            "first_id": last_id - inserted + 1,
+            "message": f"Added {inserted} expenses"
+        }
+
+@mcp.tool()
+def get_expense(expense_id: int) -> Dict[str, Any]:
+    '''Get a specific expense by ID.'''
+    with _LOCK:
+        conn = _CONN
+        cursor = conn.execute(
+            "SELECT id, date, amount, category, subcategory, note FROM expenses WHERE id = ?",
+            (expense_id,)
+        )
+        row = cursor.fetchone()
+        
+        if not row:
+            return {"status": "error", "message": f"Expense with ID {expense_id} not found"}
+        
+        return {"status": "success", "expense": dict(row)}
+
+# list_expenses has three optional filters, so there are only eight possible
+# queries. Build them once, indexed by a bitmask of the filters present, so the
+# SQL text is identical across calls and stays in the statement cache.
+_LIST_FILTERS = ("date >= ?", "date <= ?", "category = ?")
+_LIST_SQL = {}
+for _mask in range(1 << len(_LIST_FILTERS)):
+    _conditions = [c for i, c in enumerate(_LIST_FILTERS) if _mask & (1 << i)]
+    _LIST_SQL[_mask] = (
+        f"SELECT {_EXPENSE_COLUMNS} FROM expenses"
+        + (" WHERE " + " AND ".join(_conditions) if _conditions else "")
+        + " ORDER BY date DESC, id DESC LIMIT ?"
+    )
+del _mask, _conditions
+
+@mcp.tool()
+def list_expenses(
+    start_date: Optional[str] = None, 
+    end_date: Optional[str] = None,
+    category: Optional[str] = None,
+    limit: int = 100
+) -> List[Dict[str, Any]]:
+    '''List expense entries with optional filters.
+    
+    Args:
+        start_date: Start date filter (YYYY-MM-DD)
+        end_date: End date filter (YYYY-MM-DD)
+        category: Filter by category
+        limit: Maximum number of records to return
+    '''
+    mask = bool(start_date) | bool(end_date) << 1 | bool(category) << 2
+    params = [p for p in (start_date, end_date, category) if p]
+    params.append(limit)
+    
+    with _LOCK:
+        conn = _CONN
+        cursor = conn.execute(_LIST_SQL[mask], params)
+        return [dict(row) for row in cursor]
+
+@mcp.tool()
+def update_expense(
+    expense_id: int,
+    date: Optional[str] = None,
+    amount: Optional[float] = None,
+    category: Optional[str] = None,
+    subcategory: Optional[str] = None,
+    note: Optional[str] = None
+) -> Dict[str, Any]:
+    '''Update an existing expense entry, returning the updated entry.
+    
+    Args:
+        expense_id: ID of expense to update
+        date: New date (YYYY-MM-DD)
+        amount: New amount
+        category: New category
+        subcategory: New subcategory
+        note: New note
+    '''
+    if date:
+        if not _valid_date(date):
+            return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
+    else:
+        date = None
+    
+    if amount is not None and amount <= 0:
+        return {"status": "error", "message": "Amount must be positive"}
+    
+    if all(v is None for v in (date, amount, category, subcategory, note)):
+        return {"status": "error", "message": "No fields to update"}
+    
+    # A single fixed statement: COALESCE keeps the current value for any field
+    # left as None, and the returned row (or its absence) tells us whether the
+    # expense exists.
+    query = """
+        UPDATE expenses SET
+            date = COALESCE(?, date),
+            amount = COALESCE(?, amount),
+            category = COALESCE(?, category),
+            subcategory = COALESCE(?, subcategory),
+            note = COALESCE(?, note),
+            updated_at = CURRENT_TIMESTAMP
+        WHERE id = ?
+    """
+    params = (date, amount, category, subcategory, note, expense_id)
+    
+    with _transaction() as conn:
+        if _HAS_RETURNING:
+            row = conn.execute(query + f" RETURNING {_RETURNING_COLUMNS}", params).fetchone()
+        elif conn.execute(query, params).rowcount > 0:
+            row = conn.execute(
+                f"SELECT {_EXPENSE_COLUMNS} FROM expenses WHERE id = ?", (expense_id,)
+            ).fetchone()
+        else:
+            row = None
+        
+        if row:
+            return {
+                "status": "success",
+                "expense": dict(row),
+                "message": f"Expense {expense_id} updated successfully"
+            }
+        else:
+            return {"status": "error", "message": f"Expense with ID {expense_id} not found"}
+
+@mcp.tool()
+def delete_expense(expense_id: int) -> Dict[str, Any]:
+    '''Delete an expense entry by ID, returning the deleted entry.'''
+    with _transaction() as conn:
+        if _HAS_RETURNING:
+            row = conn.execute(
+                f"DELETE FROM expenses WHERE id = ? RETURNING {_RETURNING_COLUMNS}", (expense_id,)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                f"SELECT {_EXPENSE_COLUMNS} FROM expenses WHERE id = ?", (expense_id,)
+            ).fetchone()
+            conn.execute("DELETE FROM expenses WHERE id = ?", (expense_id,))
+        
+        if row:
+            return {
+                "status": "success",
+                "expense": dict(row),
+                "message": f"Expense {expense_id} deleted successfully"
+            }
+        else:
+            return {"status": "error", "message": f"Expense with ID {expense_id} not found"}
+
+@mcp.tool()
+def delete_expenses_by_date_range(start_date: str, end_date: str) -> Dict[str, Any]:
+    '''Delete all expenses within a date range.
+    
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+    '''
+    if not (_valid_date(start_date) and _valid_date(end_date)):
+        return {"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}
+    
+    with _transaction() as conn:
+        cursor = conn.execute(
+            "DELETE FROM expenses WHERE date BETWEEN ? AND ?",
+            (start_date, end_date)
+        )
+        
+        deleted_count = cursor.rowcount
+        return {
+            "status": "success", 
+            "message": f"Deleted {deleted_count} expenses from {start_date} to {end_date}"
+        }
+
+# Same idea for summarize: bit 0 is the category filter, bit 1 grouping by
+# subcategory. Each shape aggregates the pre-summed per-day rows instead of
+# every expense.
+_SUMMARY_SQL = {}
+for _mask in range(4):
+    _group = "category, subcategory" if _mask & 2 else "category"
+    _SUMMARY_SQL[_mask] = (
+        f"SELECT {_group}, SUM(cnt) as count, SUM(total) as total_amount,"
+        " SUM(total) / SUM(cnt) as average_amount"
+        " FROM agg_by_day_cat WHERE date BETWEEN ? AND ?"
+        + (" AND category = ?" if _mask & 1 else "")
+        + f" GROUP BY {_group} ORDER BY total_amount DESC"
+    )
+del _mask, _group
+
+@mcp.tool()
+def summarize(
+    start_date: str, 
+    end_date: str, 
+    category: Optional[str] = None,
+    group_by_subcategory: bool = False
+) -> List[Dict[str, Any]]:
+    '''Summarize expenses within a date range.
+    
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD)
+        category: Optional category filter
+        group_by_subcategory: If True, group by subcategory within category
+    '''
+    if not (_valid_date(start_date) and _valid_date(end_date)):
+        return [{"status": "error", "message": "Invalid date format. Use YYYY-MM-DD"}]
+    
+    mask = bool(category) | bool(group_by_subcategory) << 1
+    params = [start_date, end_date]
+    if category:
+        params.append(category)
+    
+    with _LOCK:
+        conn = _CONN
+        cursor = conn.execute(_SUMMARY_SQL[mask], params)
+        return [dict(row) for row in cursor]
+
+@mcp.tool()
+def get_statistics() -> Dict[str, Any]:
+    '''Get overall expense statistics.'''
+    with _LOCK:
+        conn = _CONN
+        stats = {}
+        
+        # Totals come from the monthly rollup rather than a full table scan
+        cursor = conn.execute("SELECT SUM(count), SUM(total) FROM monthly_rollup")
+        count, total = cursor.fetchone()
+        stats["total_expenses"] = count or 0
+        stats["total_amount"] = total or 0
+        
+        # Average expense
+        stats["average_expense"] = total / count if count else 0
+        
+        # Most recent expense
+        cursor = conn.execute("""
+            SELECT date, amount, category 
+            FROM expenses 
+            ORDER BY date DESC, id DESC 
+            LIMIT 1
+        """)
+        recent = cursor.fetchone()
+        if recent:
+            stats["most_recent"] = dict(recent)
+        
+        # Expenses by month (current year)
+        cursor = conn.execute("""
+            SELECT month, count, total
+            FROM monthly_rollup
+            WHERE month BETWEEN strftime('%Y-01', 'now') AND strftime('%Y-12', 'now')
+            ORDER BY month DESC
+        """)
+        stats["monthly_summary"] = [dict(row) for row in cursor]
+        
+        return {"status": "success", "statistics": stats}
+
+@mcp.tool()
+def export_expenses(format: str = "json") -> Dict[str, Any]:
+    '''Export all expenses in specified format.
+    
+    Args:
+        format: Export format - "json" or "csv"
+    '''
+    fmt = format.lower()
+    if fmt not in ("json", "csv"):
+        return {"status": "error", "message": "Unsupported format. Use 'json' or 'csv'"}
+    
+    # An export can be arbitrarily large, so it reads through its own
+    # short-lived read-only connection instead of holding _LOCK on the shared
+    # one; under WAL it sees a consistent snapshot while writers carry on.
+    # Rows are written into the output buffer straight off the cursor, so
+    # only one row is held as Python objects at a time.
+    buf = io.StringIO()
+    count = 0
+    conn = sqlite3.connect(pathlib.Path(DB_PATH).as_uri() + "?mode=ro", uri=True)
+    try:
+        conn.row_factory = sqlite3.Row
+        cursor = conn.execute(
+            f"SELECT {_EXPENSE_COLUMNS} FROM expenses ORDER BY date DESC, id DESC"
+        )
+        if fmt == "json":
+            buf.write("[")
+            for row in cursor:
+                if count:
+                    buf.write(",")
+                buf.write(json.dumps(dict(row), separators=(",", ":")))
+                count += 1
+            buf.write("]")
+        else:
+            # csv.writer quotes fields containing commas, quotes or newlines
+            writer = csv.writer(buf, lineterminator="\n")
+            writer.writerow([description[0] for description in cursor.description])
+            for row in cursor:
+                writer.writerow(row)
+                count += 1
+    finally:
+        conn.close()
+    
+    data = buf.getvalue()
+    if fmt == "csv" and not count:
+        data = "No expenses found"
+    
+    return {
+        "status": "success",
+        "format": fmt,
+        "data": data,
+        "count": count
+    }
+
+# (mtime_ns, contents) of categories.json, plus when the mtime was last checked
+_CAT_CACHE: Optional[tuple] = None
+_CAT_CHECKED_AT = 0.0
+_CAT_CHECK_INTERVAL = 1.0  # seconds
+
+@mcp.resource("expense://categories", mime_type="application/json")
+def categories() -> str:
+    '''Get expense categories from JSON file.'''
+    global _CAT_CACHE, _CAT_CHECKED_AT
+    
+    # The file rarely changes, so serve it from memory and only stat it
+    # again once the check interval has passed
+    now = time.monotonic()
+    if _CAT_CACHE is not None and now - _CAT_CHECKED_AT < _CAT_CHECK_INTERVAL:
+        return _CAT_CACHE[1]
+    
+    try:
+        try:
+            st = os.stat(CATEGORIES_PATH)
+        except FileNotFoundError:
+            # Create default categories file if it doesn't exist
+            default_categories = {
+                "categories": [
+                    {"name": "Food", "subcategories": ["Groceries", "Restaurants", "Takeout", "Coffee"]},
+                    {"name": "Transportation", "subcategories": ["Fuel", "Public Transit", "Taxi", "Maintenance"]},
+                    {"name": "Housing", "subcategories": ["Rent", "Utilities", "Maintenance", "Furniture"]},
+                    {"name": "Entertainment", "subcategories": ["Movies", "Games", "Concerts", "Hobbies"]},
+                    {"name": "Shopping", "subcategories": ["Clothing", "Electronics", "Gifts", "Household"]},
+                    {"name": "Health", "subcategories": ["Medical", "Pharmacy", "Fitness", "Insurance"]},
+                    {"name": "Education", "subcategories": ["Books", "Courses", "Software", "Subscriptions"]},
+                    {"name": "Other", "subcategories": ["Miscellaneous"]}
+                ]
+            }
+            with open(CATEGORIES_PATH, "w", encoding="utf-8") as f:
+                json.dump(default_categories, f, indent=2)
+            st = os.stat(CATEGORIES_PATH)
+        
+        _CAT_CHECKED_AT = now
+        if _CAT_CACHE is None or _CAT_CACHE[0] != st.st_mtime_ns:
+            with open(CATEGORIES_PATH, "r", encoding="utf-8") as f:
+                _CAT_CACHE = (st.st_mtime_ns, f.read())
+        return _CAT_CACHE[1]
+    except Exception as e:
+        return json.dumps({"error": str(e)})
+
+if __name__ == "__main__":
+    mcp.run()
\ No newline at end of file